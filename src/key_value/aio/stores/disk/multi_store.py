@@ -1,5 +1,6 @@
-from collections.abc import Callable
-from datetime import timezone
+import asyncio
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import overload
 
@@ -7,14 +8,17 @@ from typing_extensions import override
 
 from key_value.aio.stores.base import BaseContextManagerStore, BaseStore
 from key_value.aio.stores.disk.store import (
+    _UTC,
+    DiskSerializationAdapter,
     _create_disk_cache,
+    _create_write_executor,
     _disk_cache_close,
-    _disk_cache_delete,
     _disk_cache_get_with_expire,
-    _disk_cache_set,
+    _DiskCacheWriter,
+    _from_ts,
+    _run_in_executor,
 )
 from key_value.shared.managed_entry import ManagedEntry, datetime
-from key_value.shared.serialization import BasicSerializationAdapter
 
 try:
     from diskcache import Cache
@@ -35,11 +39,19 @@ def _sanitize_collection_for_filesystem(collection: str) -> str:
 class MultiDiskStore(BaseContextManagerStore, BaseStore):
     """A disk-based store that uses the diskcache library to store data. The MultiDiskStore by default creates
     one diskcache Cache instance per collection created by the caller but a custom factory function can be provided
-    to tightly control the creation of the diskcache Cache instances."""
+    to tightly control the creation of the diskcache Cache instances.
+
+    Every collection has its own SQLite database. Reads and writes for all collections run on one shared
+    thread, which holds a connection to each collection's database. When working with many collections, use
+    `DiskStore` instead, which stores all collections in a single database."""
 
     _cache: dict[str, Cache]
+    _executor: ThreadPoolExecutor
+    _writers: dict[str, _DiskCacheWriter]
+    _closed: bool
 
     _disk_cache_factory: CacheFactory
+    _maintain_caches: bool
 
     _base_directory: Path
     _auto_create: bool
@@ -113,12 +125,16 @@ class MultiDiskStore(BaseContextManagerStore, BaseStore):
             return _create_disk_cache(directory=cache_directory, max_size=max_size)
 
         self._disk_cache_factory = disk_cache_factory or default_disk_cache_factory
+        # Caches built by a caller-provided factory are left untouched, as with DiskStore's disk_cache
+        self._maintain_caches = disk_cache_factory is None
 
         self._cache = {}
-
-        self._serialization_adapter = BasicSerializationAdapter()
+        self._executor = _create_write_executor()
+        self._writers = {}
+        self._closed = False
 
         super().__init__(
+            serialization_adapter=DiskSerializationAdapter(),
             default_collection=default_collection,
             stable_api=True,
         )
@@ -126,17 +142,41 @@ class MultiDiskStore(BaseContextManagerStore, BaseStore):
     @override
     async def _setup(self) -> None:
         """Register cache cleanup."""
-        self._exit_stack.callback(self._sync_close)
+        self._exit_stack.push_async_callback(self._close)
 
     @override
     async def _setup_collection(self, *, collection: str) -> None:
         self._cache[collection] = self._disk_cache_factory(collection)
+        self._writers[collection] = _DiskCacheWriter(
+            cache=self._cache[collection], executor=self._executor, maintenance=self._maintain_caches
+        )
+
+    def _ensure_open(self) -> None:
+        """Recreate the executor and writers if the store has been closed.
+
+        The caches are kept on close because diskcache reopens its connections on demand, so only the
+        executor and writers need to be recreated and their cleanup registered again.
+        """
+        if not self._closed:
+            return
+
+        self._executor = _create_write_executor()
+        self._writers = {
+            collection: _DiskCacheWriter(cache=cache, executor=self._executor, maintenance=self._maintain_caches)
+            for collection, cache in self._cache.items()
+        }
+        self._closed = False
+        self._exit_stack.push_async_callback(self._close)
 
     @override
     async def _get_managed_entry(self, *, key: str, collection: str) -> ManagedEntry | None:
+        self._ensure_open()
+
         expire_epoch: float | None
 
-        managed_entry_str, expire_epoch = _disk_cache_get_with_expire(cache=self._cache[collection], key=key)
+        managed_entry_str, expire_epoch = await _run_in_executor(
+            self._executor, _disk_cache_get_with_expire, cache=self._cache[collection], key=key
+        )
 
         if not isinstance(managed_entry_str, str):
             return None
@@ -144,7 +184,7 @@ class MultiDiskStore(BaseContextManagerStore, BaseStore):
         managed_entry: ManagedEntry = self._serialization_adapter.load_json(json_str=managed_entry_str)
 
         if expire_epoch:
-            managed_entry.expires_at = datetime.fromtimestamp(expire_epoch, tz=timezone.utc)
+            managed_entry.expires_at = _from_ts(expire_epoch, tz=_UTC)
 
         return managed_entry
 
@@ -156,20 +196,79 @@ class MultiDiskStore(BaseContextManagerStore, BaseStore):
         collection: str,
         managed_entry: ManagedEntry,
     ) -> None:
-        _ = _disk_cache_set(
-            cache=self._cache[collection],
+        self._ensure_open()
+
+        await self._writers[collection].set(
             key=key,
             value=self._serialization_adapter.dump_json(entry=managed_entry, key=key, collection=collection),
             expire=managed_entry.ttl,
         )
 
+    @override
+    async def _put_managed_entries(
+        self,
+        *,
+        collection: str,
+        keys: Sequence[str],
+        managed_entries: Sequence[ManagedEntry],
+        ttl: float | None,
+        created_at: datetime,
+        expires_at: datetime | None,
+    ) -> None:
+        if not keys:
+            return
+
+        self._ensure_open()
+
+        # All entries in the batch share the TTL computed once by put_many, so reuse it rather
+        # than reading the clock again for each entry via managed_entry.ttl.
+        await self._writers[collection].set_many(
+            items=[
+                (key, self._serialization_adapter.dump_json(entry=managed_entry, key=key, collection=collection), ttl)
+                for key, managed_entry in zip(keys, managed_entries, strict=True)
+            ],
+        )
+
     @override
     async def _delete_managed_entry(self, *, key: str, collection: str) -> bool:
-        return _disk_cache_delete(cache=self._cache[collection], key=key)
+        self._ensure_open()
 
-    def _sync_close(self) -> None:
-        for cache in self._cache.values():
+        return await self._writers[collection].delete(key=key)
+
+    @override
+    async def _delete_managed_entries(self, *, keys: Sequence[str], collection: str) -> int:
+        if not keys:
+            return 0
+
+        self._ensure_open()
+
+        return await self._writers[collection].delete_many(keys=keys)
+
+    async def _close(self) -> None:
+        # Only the first call after the store was last used does anything
+        if self._closed:
+            return
+        self._closed = True
+
+        # The caches are kept so the store can be reused; diskcache reopens their connections on demand.
+        # Capture the executor, as an operation running while we wait reopens the store with a new one.
+        executor = self._executor
+        writers = list(self._writers.values())
+        caches = list(self._cache.values())
+        self._writers.clear()
+
+        for writer in writers:
+            writer.close(close_cache=True)
+        await asyncio.to_thread(executor.shutdown)
+        for cache in caches:
             _disk_cache_close(cache=cache)
 
     def __del__(self) -> None:
-        self._sync_close()
+        # Finalizers may run at interpreter exit, when executors no longer accept work, so only signal the
+        # threads to stop without submitting anything or waiting. _closed is unset if __init__ failed early.
+        if getattr(self, "_closed", True):
+            return
+
+        self._executor.shutdown(wait=False)
+        for cache in self._cache.values():
+            _disk_cache_close(cache=cache)
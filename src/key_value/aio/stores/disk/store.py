@@ -1,19 +1,84 @@
+import asyncio
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, overload
+from typing import Any, ParamSpec, TypeVar, overload
 
 from typing_extensions import override
 
 from key_value.aio.stores.base import BaseContextManagerStore, BaseStore
 from key_value.shared.compound import compound_key
 from key_value.shared.managed_entry import ManagedEntry
+from key_value.shared.serialization import SerializationAdapter
 
 try:
     from diskcache import Cache
+    from diskcache.core import DBNAME
 except ImportError as e:
     msg = "DiskStore requires py-key-value-aio[disk]"
     raise ImportError(msg) from e
 
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# Bound once at import time so the get path avoids repeated global and attribute lookups
+_UTC = timezone.utc
+_from_ts = datetime.fromtimestamp
+
+# SQLite pragmas applied to caches created by the store. diskcache persists `sqlite_*` settings
+# and re-applies them to every connection it opens. WAL and synchronous=NORMAL are diskcache's
+# defaults; they are listed here to make the durability trade-off explicit. The page cache is
+# left at diskcache's default of 8192 pages: it is allocated per connection and the store opens
+# several connections per cache (see `_DISK_STORE_READ_WORKERS`), so raising it multiplies memory
+# use, while the memory map already lets every connection share the OS page cache.
+_DISK_CACHE_SQLITE_SETTINGS: dict[str, Any] = {
+    "sqlite_journal_mode": "wal",
+    "sqlite_synchronous": 1,  # NORMAL
+    "sqlite_temp_store": 2,  # MEMORY
+    "sqlite_mmap_size": 2**28,  # 256mb
+    "sqlite_wal_autocheckpoint": 1000,  # pages
+}
+
+
+class DiskSerializationAdapter(SerializationAdapter):
+    """Adapter for diskcache, which tracks expiration natively.
+
+    The expiration time is kept in diskcache's own `expire_time` column, so it is left out of the
+    serialized document and restored from the cache when the entry is read back.
+    """
+
+    @override
+    def prepare_dump(self, data: dict[str, Any]) -> dict[str, Any]:
+        data.pop("expires_at", None)
+        return data
+
+    @override
+    def prepare_load(self, data: dict[str, Any]) -> dict[str, Any]:
+        return data
+
+
+# Number of reader threads a DiskStore uses to serve gets, alongside its single writer thread.
+# diskcache opens one connection per thread per cache, so the store holds at most this many plus two
+# connections (the writer's and the calling thread's). MultiDiskStore does not use a reader pool, as
+# it would open a connection per reader to every collection's cache.
+_DISK_STORE_READ_WORKERS = 4
+
+# Refresh planner statistics and run a truncating WAL checkpoint after this many writes or this many
+# seconds, whichever comes first. The time is only checked when a write happens.
+_DISK_CACHE_MAINTENANCE_WRITES = 10_000
+_DISK_CACHE_MAINTENANCE_INTERVAL = 15 * 60
+
+# Rows sampled per index when maintenance falls back to ANALYZE, keeping each pass fast on large caches.
+_DISK_CACHE_ANALYSIS_LIMIT = 400
+
 
 # Module-level helper functions for DiskStore cache operations
 
@@ -33,8 +98,8 @@ def _create_disk_cache(
         A diskcache Cache instance.
     """
     if max_size is not None and max_size > 0:
-        return Cache(directory=directory, size_limit=max_size)
-    return Cache(directory=directory, eviction_policy="none")
+        return Cache(directory=directory, size_limit=max_size, **_DISK_CACHE_SQLITE_SETTINGS)
+    return Cache(directory=directory, eviction_policy="none", **_DISK_CACHE_SQLITE_SETTINGS)
 
 
 def _disk_cache_get_with_expire(cache: Cache, key: str) -> tuple[Any, float | None]:
@@ -50,25 +115,23 @@ def _disk_cache_get_with_expire(cache: Cache, key: str) -> tuple[Any, float | No
     return cache.get(key=key, expire_time=True)
 
 
-def _disk_cache_set(
+def _disk_cache_set_many(
     cache: Cache,
-    key: str,
-    value: str,
-    *,
-    expire: float | None = None,
-) -> bool:
-    """Set a value in the cache.
+    items: Sequence[tuple[str, str, float | None]],
+) -> None:
+    """Set multiple values in the cache within a single transaction.
+
+    Wrapping the writes in one transaction means the whole batch pays for a single commit
+    instead of one commit per entry.
 
     Args:
         cache: The diskcache Cache instance.
-        key: The key to set.
-        value: The value to store.
-        expire: Optional expiration time in seconds.
-
-    Returns:
-        True if successful.
+        items: A sequence of (key, value, expire) tuples, where expire is an optional
+            expiration time in seconds.
     """
-    return cache.set(key=key, value=value, expire=expire)
+    with cache.transact():
+        for key, value, expire in items:
+            _ = cache.set(key=key, value=value, expire=expire)
 
 
 def _disk_cache_delete(cache: Cache, key: str) -> bool:
@@ -84,6 +147,20 @@ def _disk_cache_delete(cache: Cache, key: str) -> bool:
     return cache.delete(key=key, retry=True)
 
 
+def _disk_cache_delete_many(cache: Cache, keys: Sequence[str]) -> int:
+    """Delete multiple keys from the cache within a single transaction.
+
+    Args:
+        cache: The diskcache Cache instance.
+        keys: The keys to delete.
+
+    Returns:
+        The number of keys that were deleted.
+    """
+    with cache.transact(retry=True):
+        return sum(cache.delete(key=key, retry=True) for key in keys)
+
+
 def _disk_cache_clear(cache: Cache) -> int:  # pyright: ignore[reportUnusedFunction] - Used by tests
     """Clear all items from the cache.
 
@@ -105,10 +182,194 @@ def _disk_cache_close(cache: Cache) -> None:
     cache.close()
 
 
+def _disk_cache_maintenance(cache: Cache) -> None:
+    """Refresh the query planner statistics and truncate the write-ahead log of the cache.
+
+    Maintenance is best-effort: the connection does not wait for locks, so if the database is busy the
+    statistics are skipped, or the checkpoint stops at the oldest open reader, until the next interval.
+
+    Args:
+        cache: The diskcache Cache instance.
+    """
+    with closing(sqlite3.connect(Path(cache.directory) / DBNAME, timeout=0)) as connection:
+        try:
+            # A plain `PRAGMA optimize` only considers tables queried on the same connection, which this
+            # fresh connection has not done. Flag 0x10000 makes it check every table but needs SQLite 3.46;
+            # before that, run a bounded ANALYZE instead.
+            if sqlite3.sqlite_version_info >= (3, 46, 0):
+                _ = connection.execute("PRAGMA optimize=0x10002")
+            else:
+                _ = connection.execute(f"PRAGMA analysis_limit={_DISK_CACHE_ANALYSIS_LIMIT}")
+                _ = connection.execute("ANALYZE")
+            _ = connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.OperationalError:
+            return
+
+
+def _log_maintenance_failure(future: Future[None]) -> None:
+    """Log an unexpected maintenance failure, which would otherwise be lost with the discarded future."""
+    if (exception := future.exception()) is not None:
+        logger.error("Disk cache maintenance failed", exc_info=exception)
+
+
+def _create_write_executor() -> ThreadPoolExecutor:
+    """Create the single-worker executor that runs blocking diskcache writes."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-store-write")
+
+
+def _create_read_executor() -> ThreadPoolExecutor:
+    """Create the executor that runs blocking diskcache reads.
+
+    Each worker thread lazily opens its own connection, giving a small pool of reader
+    connections. In WAL mode these read concurrently with each other and with the writer.
+    """
+    return ThreadPoolExecutor(max_workers=_DISK_STORE_READ_WORKERS, thread_name_prefix="disk-store-read")
+
+
+async def _run_in_executor(executor: ThreadPoolExecutor, func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a blocking function on the executor without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+class _DiskCacheWriter:
+    """Runs every write to a cache on a single-worker executor.
+
+    diskcache keeps one SQLite connection per thread, so a single worker serializes all of the cache's
+    writes on one connection, in the order they were made. Single-entry writes queued in the same event
+    loop iteration are committed in one transaction, and periodic maintenance runs on the same thread
+    between writes. The executor is owned, and shut down, by the store, which may share it between caches.
+    """
+
+    _cache: Cache
+    _executor: ThreadPoolExecutor
+    _maintenance: bool
+    _pending: list[tuple[tuple[str, str, float | None], asyncio.Future[None]]]
+    _writes_since_maintenance: int
+    _last_maintenance: float
+
+    def __init__(self, *, cache: Cache, executor: ThreadPoolExecutor, maintenance: bool) -> None:
+        """Initialize the writer.
+
+        Args:
+            cache: The diskcache Cache instance to write to.
+            executor: The single-worker executor to run writes on.
+            maintenance: Whether to run periodic maintenance. Caches provided by the caller are left untouched.
+        """
+        self._cache = cache
+        self._executor = executor
+        self._maintenance = maintenance
+        self._pending = []
+        self._writes_since_maintenance = 0
+        self._last_maintenance = time.monotonic()
+
+    async def set(self, *, key: str, value: str, expire: float | None = None) -> None:
+        """Queue a write and wait until the batch containing it has been committed."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[None] = loop.create_future()
+
+        if not self._pending:
+            _ = loop.call_soon(self._flush, loop)
+
+        self._pending.append(((key, value, expire), future))
+
+        await future
+
+    async def set_many(self, *, items: Sequence[tuple[str, str, float | None]]) -> None:
+        self._flush(asyncio.get_running_loop())
+        await _run_in_executor(self._executor, _disk_cache_set_many, cache=self._cache, items=items)
+        self._record_writes(count=len(items))
+
+    async def delete(self, *, key: str) -> bool:
+        self._flush(asyncio.get_running_loop())
+        deleted = await _run_in_executor(self._executor, _disk_cache_delete, cache=self._cache, key=key)
+        self._record_writes(count=1)
+        return deleted
+
+    async def delete_many(self, *, keys: Sequence[str]) -> int:
+        self._flush(asyncio.get_running_loop())
+        deleted_count = await _run_in_executor(self._executor, _disk_cache_delete_many, cache=self._cache, keys=keys)
+        self._record_writes(count=len(keys))
+        return deleted_count
+
+    def close(self, *, close_cache: bool) -> None:
+        """Prepare the writer for its executor to be shut down.
+
+        Puts still waiting to be flushed are submitted first, so they commit before the executor stops.
+
+        Args:
+            close_cache: Whether to close the writer thread's connection to the cache after queued writes.
+        """
+        self._flush(asyncio.get_running_loop())
+
+        if close_cache:
+            _ = self._executor.submit(_disk_cache_close, cache=self._cache)
+
+    def _flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Submit the queued single-entry writes as one batch.
+
+        The executor has a single worker, so writes commit in the order they are submitted. Every other
+        write calls this first so that it cannot overtake puts that were queued before it.
+        """
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        futures = [future for _, future in pending]
+
+        try:
+            write = loop.run_in_executor(
+                self._executor, partial(_disk_cache_set_many, cache=self._cache, items=[item for item, _ in pending])
+            )
+        except RuntimeError as e:
+            # The executor has been shut down
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        write.add_done_callback(partial(_resolve_futures, futures=futures))
+        self._record_writes(count=len(pending))
+
+    def _record_writes(self, *, count: int) -> None:
+        """Count writes and schedule maintenance after enough writes or enough time has passed."""
+        if not self._maintenance:
+            return
+
+        self._writes_since_maintenance += count
+
+        if (
+            self._writes_since_maintenance < _DISK_CACHE_MAINTENANCE_WRITES
+            and time.monotonic() - self._last_maintenance < _DISK_CACHE_MAINTENANCE_INTERVAL
+        ):
+            return
+
+        self._writes_since_maintenance = 0
+        self._last_maintenance = time.monotonic()
+        maintenance = self._executor.submit(_disk_cache_maintenance, cache=self._cache)
+        maintenance.add_done_callback(_log_maintenance_failure)
+
+
+def _resolve_futures(write: asyncio.Future[None], *, futures: Sequence[asyncio.Future[None]]) -> None:
+    """Propagate the outcome of a batched write to the futures of every write in the batch."""
+    for future in futures:
+        if future.done():
+            continue
+        if write.cancelled():
+            _ = future.cancel()
+        elif (exception := write.exception()) is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(None)
+
+
 class DiskStore(BaseContextManagerStore, BaseStore):
     """A disk-based store that uses the diskcache library to store data."""
 
     _cache: Cache
+    _read_executor: ThreadPoolExecutor
+    _write_executor: ThreadPoolExecutor
+    _writer: _DiskCacheWriter
+    _closed: bool
     _auto_create: bool
 
     @overload
@@ -167,7 +428,8 @@ class DiskStore(BaseContextManagerStore, BaseStore):
         self._client_provided_by_user = client_provided
         self._auto_create = auto_create
 
-        if disk_cache:
+        # An empty Cache is falsy, so compare against None
+        if disk_cache is not None:
             self._cache = disk_cache
         elif directory:
             directory = Path(directory)
@@ -180,7 +442,13 @@ class DiskStore(BaseContextManagerStore, BaseStore):
 
             self._cache = _create_disk_cache(directory=directory, max_size=max_size)
 
+        self._read_executor = _create_read_executor()
+        self._write_executor = _create_write_executor()
+        self._writer = _DiskCacheWriter(cache=self._cache, executor=self._write_executor, maintenance=not self._client_provided_by_user)
+        self._closed = False
+
         super().__init__(
+            serialization_adapter=DiskSerializationAdapter(),
             default_collection=default_collection,
             client_provided_by_user=client_provided,
             stable_api=True,
@@ -188,17 +456,35 @@ class DiskStore(BaseContextManagerStore, BaseStore):
 
     @override
     async def _setup(self) -> None:
-        """Register cache cleanup if we own the cache."""
-        if not self._client_provided_by_user:
-            self._exit_stack.callback(lambda: _disk_cache_close(cache=self._cache))
+        """Register executor shutdown and cache cleanup if we own the cache."""
+        self._exit_stack.push_async_callback(self._close)
+
+    def _ensure_open(self) -> None:
+        """Recreate the executors if the store has been closed.
+
+        diskcache reopens its connections on demand, so a closed store stays usable; the executors are
+        recreated the same way and their cleanup is registered again.
+        """
+        if not self._closed:
+            return
+
+        self._read_executor = _create_read_executor()
+        self._write_executor = _create_write_executor()
+        self._writer = _DiskCacheWriter(cache=self._cache, executor=self._write_executor, maintenance=not self._client_provided_by_user)
+        self._closed = False
+        self._exit_stack.push_async_callback(self._close)
 
     @override
     async def _get_managed_entry(self, *, key: str, collection: str) -> ManagedEntry | None:
+        self._ensure_open()
+
         combo_key: str = compound_key(collection=collection, key=key)
 
         expire_epoch: float | None
 
-        managed_entry_str, expire_epoch = _disk_cache_get_with_expire(cache=self._cache, key=combo_key)
+        managed_entry_str, expire_epoch = await _run_in_executor(
+            self._read_executor, _disk_cache_get_with_expire, cache=self._cache, key=combo_key
+        )
 
         if not isinstance(managed_entry_str, str):
             return None
@@ -206,7 +492,7 @@ class DiskStore(BaseContextManagerStore, BaseStore):
         managed_entry: ManagedEntry = self._serialization_adapter.load_json(json_str=managed_entry_str)
 
         if expire_epoch:
-            managed_entry.expires_at = datetime.fromtimestamp(expire_epoch, tz=timezone.utc)
+            managed_entry.expires_at = _from_ts(expire_epoch, tz=_UTC)
 
         return managed_entry
 
@@ -218,21 +504,86 @@ class DiskStore(BaseContextManagerStore, BaseStore):
         collection: str,
         managed_entry: ManagedEntry,
     ) -> None:
+        self._ensure_open()
+
         combo_key: str = compound_key(collection=collection, key=key)
 
-        _ = _disk_cache_set(
-            cache=self._cache,
+        await self._writer.set(
             key=combo_key,
             value=self._serialization_adapter.dump_json(entry=managed_entry, key=key, collection=collection),
             expire=managed_entry.ttl,
         )
 
+    @override
+    async def _put_managed_entries(
+        self,
+        *,
+        collection: str,
+        keys: Sequence[str],
+        managed_entries: Sequence[ManagedEntry],
+        ttl: float | None,
+        created_at: datetime,
+        expires_at: datetime | None,
+    ) -> None:
+        if not keys:
+            return
+
+        self._ensure_open()
+
+        # All entries in the batch share the TTL computed once by put_many, so reuse it rather
+        # than reading the clock again for each entry via managed_entry.ttl.
+        await self._writer.set_many(
+            items=[
+                (
+                    compound_key(collection=collection, key=key),
+                    self._serialization_adapter.dump_json(entry=managed_entry, key=key, collection=collection),
+                    ttl,
+                )
+                for key, managed_entry in zip(keys, managed_entries, strict=True)
+            ],
+        )
+
     @override
     async def _delete_managed_entry(self, *, key: str, collection: str) -> bool:
+        self._ensure_open()
+
         combo_key: str = compound_key(collection=collection, key=key)
 
-        return _disk_cache_delete(cache=self._cache, key=combo_key)
+        return await self._writer.delete(key=combo_key)
+
+    @override
+    async def _delete_managed_entries(self, *, keys: Sequence[str], collection: str) -> int:
+        if not keys:
+            return 0
+
+        self._ensure_open()
+
+        return await self._writer.delete_many(keys=[compound_key(collection=collection, key=key) for key in keys])
+
+    async def _close(self) -> None:
+        # Only the first call after the store was last used does anything
+        if self._closed:
+            return
+        self._closed = True
+
+        # Capture the executors, as an operation running while we wait reopens the store with new ones
+        read_executor, write_executor, writer = self._read_executor, self._write_executor, self._writer
+
+        writer.close(close_cache=not self._client_provided_by_user)
+        await asyncio.to_thread(write_executor.shutdown)
+        await asyncio.to_thread(read_executor.shutdown)
+
+        if not self._client_provided_by_user:
+            _disk_cache_close(cache=self._cache)
 
     def __del__(self) -> None:
-        if not getattr(self, "_client_provided_by_user", False) and hasattr(self, "_cache"):
+        # Finalizers may run at interpreter exit, when executors no longer accept work, so only signal the
+        # threads to stop without submitting anything or waiting. _closed is unset if __init__ failed early.
+        if getattr(self, "_closed", True):
+            return
+
+        self._read_executor.shutdown(wait=False)
+        self._write_executor.shutdown(wait=False)
+
+        if not self._client_provided_by_user:
             _disk_cache_close(cache=self._cache)
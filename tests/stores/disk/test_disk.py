@@ -1,14 +1,19 @@
+import asyncio
 import json
+import sqlite3
+import time
+from collections.abc import Sequence
+from contextlib import closing
 from pathlib import Path
 
 import pytest
 from dirty_equals import IsDatetime
-from diskcache.core import Cache
+from diskcache.core import DBNAME, Cache
 from inline_snapshot import snapshot
 from typing_extensions import override
 
 from key_value.aio.stores.disk import DiskStore
-from key_value.aio.stores.disk.store import _disk_cache_clear
+from key_value.aio.stores.disk.store import _disk_cache_clear, _disk_cache_maintenance, _disk_cache_set_many
 from tests.stores.base import BaseStoreTests, ContextManagerStoreTestMixin
 
 TEST_SIZE_LIMIT = 100 * 1024  # 100KB
@@ -54,7 +59,170 @@ class TestDiskStore(ContextManagerStoreTestMixin, BaseStoreTests):
                 "created_at": IsDatetime(iso_string=True),
                 "value": {"age": 30, "name": "Alice"},
                 "key": "test_key",
-                "expires_at": IsDatetime(iso_string=True),
                 "version": 1,
             }
         )
+
+    async def test_concurrent_puts(self, store: DiskStore, monkeypatch: pytest.MonkeyPatch):
+        keys = [f"test_key_{i}" for i in range(20)]
+        values = [{"index": i} for i in range(20)]
+
+        await store.setup_collection(collection="test")
+
+        batches: list[int] = []
+
+        def recording_set_many(cache: Cache, items: Sequence[tuple[str, str, float | None]]) -> None:
+            batches.append(len(items))
+            _disk_cache_set_many(cache=cache, items=items)
+
+        monkeypatch.setattr("key_value.aio.stores.disk.store._disk_cache_set_many", recording_set_many)
+
+        _ = await asyncio.gather(*[store.put(collection="test", key=key, value=value) for key, value in zip(keys, values, strict=True)])
+
+        assert batches == [20]
+        assert await store.get_many(collection="test", keys=keys) == values
+
+    async def test_concurrent_writes_keep_order(self, store: DiskStore):
+        _ = await asyncio.gather(
+            store.put(collection="test", key="test_key", value={"version": 1}),
+            store.put_many(collection="test", keys=["test_key"], values=[{"version": 2}]),
+        )
+        assert await store.get(collection="test", key="test_key") == {"version": 2}
+
+        _ = await asyncio.gather(
+            store.put(collection="test", key="test_key", value={"version": 3}),
+            store.delete(collection="test", key="test_key"),
+        )
+        assert await store.get(collection="test", key="test_key") is None
+
+        _ = await asyncio.gather(
+            store.put(collection="test", key="test_key", value={"version": 4}),
+            store.delete_many(collection="test", keys=["test_key"]),
+            store.put(collection="test", key="test_key", value={"version": 5}),
+        )
+        assert await store.get(collection="test", key="test_key") == {"version": 5}
+
+    async def test_maintenance_refreshes_statistics(self, store: DiskStore, disk_cache: Cache):
+        await store.put_many(collection="test", keys=[f"test_key_{i}" for i in range(100)], values=[{"index": i} for i in range(100)])
+
+        _disk_cache_maintenance(cache=disk_cache)
+
+        with closing(sqlite3.connect(Path(disk_cache.directory) / DBNAME)) as connection:
+            tables = {name for (name,) in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+        assert "sqlite_stat1" in tables
+        assert (Path(disk_cache.directory) / f"{DBNAME}-wal").stat().st_size == 0
+
+    async def test_maintenance_skips_busy_database(self, store: DiskStore, disk_cache: Cache):
+        await store.put(collection="test", key="test_key", value={"name": "Alice"})
+
+        with closing(sqlite3.connect(Path(disk_cache.directory) / DBNAME)) as reader:
+            # Hold a read snapshot that the checkpoint cannot move past
+            _ = reader.execute("BEGIN")
+            _ = reader.execute("SELECT COUNT(*) FROM Cache").fetchall()
+
+            await store.put(collection="test", key="test_key", value={"name": "Bob"})
+
+            started = time.monotonic()
+            _disk_cache_maintenance(cache=disk_cache)
+            assert time.monotonic() - started < 1
+
+    async def test_writes_trigger_maintenance(self, store: DiskStore, disk_cache: Cache, monkeypatch: pytest.MonkeyPatch):
+        passes: list[Cache] = []
+
+        def recording_maintenance(cache: Cache) -> None:
+            passes.append(cache)
+
+        monkeypatch.setattr("key_value.aio.stores.disk.store._DISK_CACHE_MAINTENANCE_WRITES", 10)
+        monkeypatch.setattr("key_value.aio.stores.disk.store._disk_cache_maintenance", recording_maintenance)
+
+        await store.put_many(collection="test", keys=[f"test_key_{i}" for i in range(6)], values=[{"index": i} for i in range(6)])
+        _ = await asyncio.gather(*[store.put(collection="test", key=f"test_key_{i}", value={"index": i}) for i in range(4)])
+        await store.put_many(collection="test", keys=[f"test_key_{i}" for i in range(9)], values=[{"index": i} for i in range(9)])
+
+        # Closing waits for the maintenance pass queued on the writer thread
+        await store.close()
+
+        assert passes == [disk_cache]
+
+    async def test_maintenance_failure_is_logged(self, store: DiskStore, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture):
+        def failing_maintenance(cache: Cache) -> None:
+            msg = "maintenance failed"
+            raise RuntimeError(msg)
+
+        monkeypatch.setattr("key_value.aio.stores.disk.store._DISK_CACHE_MAINTENANCE_WRITES", 1)
+        monkeypatch.setattr("key_value.aio.stores.disk.store._disk_cache_maintenance", failing_maintenance)
+
+        await store.put(collection="test", key="test_key", value={"name": "Alice"})
+        await store.close()
+
+        assert "Disk cache maintenance failed" in caplog.text
+
+    async def test_provided_cache_is_not_maintained(self, per_test_temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        passes: list[Cache] = []
+
+        def recording_maintenance(cache: Cache) -> None:
+            passes.append(cache)
+
+        monkeypatch.setattr("key_value.aio.stores.disk.store._DISK_CACHE_MAINTENANCE_WRITES", 1)
+        monkeypatch.setattr("key_value.aio.stores.disk.store._disk_cache_maintenance", recording_maintenance)
+
+        with Cache(directory=per_test_temp_dir / "provided") as disk_cache:
+            async with DiskStore(disk_cache=disk_cache) as store:
+                await store.put(collection="test", key="test_key", value={"name": "Alice"})
+
+        assert passes == []
+
+    async def test_close_is_idempotent(self, store: DiskStore, disk_cache: Cache, monkeypatch: pytest.MonkeyPatch):
+        await store.put(collection="test", key="test_key", value={"name": "Alice"})
+
+        closed: list[Cache] = []
+
+        def recording_close(cache: Cache) -> None:
+            closed.append(cache)
+
+        monkeypatch.setattr("key_value.aio.stores.disk.store._disk_cache_close", recording_close)
+
+        await store._close()
+        # Closed once by the writer thread and once by the calling thread
+        assert closed == [disk_cache, disk_cache]
+
+        await store._close()
+        assert closed == [disk_cache, disk_cache]
+
+    async def test_close_commits_queued_puts(self, store: DiskStore):
+        await store.setup()
+
+        _ = await asyncio.gather(store.put(collection="test", key="test_key", value={"name": "Alice"}), store.close())
+
+        assert await store.get(collection="test", key="test_key") == {"name": "Alice"}
+
+    async def test_close_does_not_block_event_loop(self, store: DiskStore):
+        await store.put(collection="test", key="test_key", value={"name": "Alice"})
+
+        # Keep the writer thread busy, as a long write or maintenance pass would
+        _ = store._writer._executor.submit(time.sleep, 0.5)
+
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        await store.close()
+        _ = heartbeat_task.cancel()
+
+        assert ticks > 10
+
+    async def test_reopen_after_close(self, store: DiskStore):
+        async with store:
+            await store.put(collection="test", key="test_key", value={"name": "Alice"})
+
+        async with store:
+            assert await store.get(collection="test", key="test_key") == {"name": "Alice"}
+            await store.put(collection="test", key="test_key", value={"name": "Bob"})
+
+        assert await store.get(collection="test", key="test_key") == {"name": "Bob"}
@@ -1,10 +1,10 @@
 import json
 from collections.abc import AsyncGenerator
 from pathlib import Path
-from typing import TYPE_CHECKING
 
 import pytest
 from dirty_equals import IsDatetime
+from diskcache.core import Cache
 from inline_snapshot import snapshot
 from typing_extensions import override
 
@@ -12,9 +12,6 @@ from key_value.aio.stores.disk.multi_store import MultiDiskStore
 from key_value.aio.stores.disk.store import _disk_cache_clear
 from tests.stores.base import BaseStoreTests, ContextManagerStoreTestMixin
 
-if TYPE_CHECKING:
-    from diskcache.core import Cache
-
 TEST_SIZE_LIMIT = 100 * 1024  # 100KB
 
 
@@ -56,7 +53,40 @@ class TestMultiDiskStore(ContextManagerStoreTestMixin, BaseStoreTests):
                 "created_at": IsDatetime(iso_string=True),
                 "value": {"age": 30, "name": "Alice"},
                 "key": "test_key",
-                "expires_at": IsDatetime(iso_string=True),
                 "version": 1,
             }
         )
+
+    async def test_close_is_idempotent(self, store: MultiDiskStore, monkeypatch: pytest.MonkeyPatch):
+        await store.put(collection="test", key="test_key", value={"name": "Alice"})
+
+        closed: list[Cache] = []
+
+        def recording_close(cache: Cache) -> None:
+            closed.append(cache)
+
+        monkeypatch.setattr("key_value.aio.stores.disk.multi_store._disk_cache_close", recording_close)
+
+        await store._close()
+        assert closed == [store._cache["test"]]
+
+        await store._close()
+        assert closed == [store._cache["test"]]
+
+    async def test_collections_share_one_thread(self, store: MultiDiskStore):
+        for i in range(20):
+            await store.put(collection=f"collection_{i}", key="test_key", value={"index": i})
+
+        assert len(store._writers) == 20
+        assert all(writer._executor is store._executor for writer in store._writers.values())
+        assert store._executor._max_workers == 1
+
+    async def test_reopen_after_close(self, store: MultiDiskStore):
+        async with store:
+            await store.put(collection="test", key="test_key", value={"name": "Alice"})
+
+        async with store:
+            assert await store.get(collection="test", key="test_key") == {"name": "Alice"}
+            await store.put(collection="test", key="test_key", value={"name": "Bob"})
+
+        assert await store.get(collection="test", key="test_key") == {"name": "Bob"}